@@ -17,12 +17,44 @@ Usage:
         exit()
 """
 
+import atexit
+import functools
 import hashlib
 import subprocess
 import platform
 import os
+import struct
 import sys
-from typing import Optional, List
+import time
+from typing import Callable, Optional, List, Dict, Set, Tuple, FrozenSet
+
+
+# Directory holding the authorized HWIDs file
+HWID_DIR = r"C:\hwid sys"
+
+# HWID hash: 1 = truncated SHA-256, 2 = BLAKE2b with a 16-byte digest (faster).
+# Changing this changes every HWID, so MASTER_HWID and the authorized file
+# must be regenerated - only switch to 2 for new deployments.
+HASH_VERSION = 1
+
+# Seconds an is_authorized() result is reused while the authorized file is unchanged
+AUTH_CACHE_TTL = 5.0
+
+# Static platform details, looked up once per process
+_SYSTEM = platform.system().lower()
+_NODE = platform.node()
+_MACHINE = platform.machine()
+
+
+@functools.lru_cache(maxsize=1)
+def _processor() -> str:
+    """Get the processor name, resolved lazily since it may spawn uname -p"""
+    return platform.processor()
+
+
+# Process-wide HWID cache keyed on the probe function, shared across HWIDLock
+# instances since the hardware doesn't change while the process is running
+_hwid_cache: Dict[Callable, str] = {}
 
 
 class HWIDLock:
@@ -36,6 +68,9 @@ class HWIDLock:
     - Cross-platform support (Windows, Linux, macOS)
     """
     
+    # Parsed authorized HWIDs per file, keyed on (mtime_ns, size, inode) to detect changes
+    _authorized_set_cache: Dict[str, Tuple[Tuple[int, int, int], FrozenSet[str]]] = {}
+    
     def __init__(self, authorized_file: str = None):
         """
         Initialize HWID Lock system
@@ -43,23 +78,39 @@ class HWIDLock:
         Args:
             authorized_file: Path to file containing authorized HWIDs
         """
-        # Ensure C:\hwid sys directory exists
-        hwid_dir = r"C:\hwid sys"
-        os.makedirs(hwid_dir, exist_ok=True)
-        
         # Set default path to C:\hwid sys
         if authorized_file is None:
-            authorized_file = os.path.join(hwid_dir, "authorized_hwids.txt")
+            authorized_file = os.path.join(HWID_DIR, "authorized_hwids.txt")
         
         self.authorized_file = authorized_file
         
         # Master HWID - Change this to your actual HWID after first run
-        # To get your HWID, run: print(HWIDLock().get_current_hwid())
+        # To get your HWID, run: python hwid_lock.py --hwid-only
         self.MASTER_HWID = "REPLACE_WITH_YOUR_MASTER_HWID"
         
-        # Create authorized file if it doesn't exist
-        if not os.path.exists(self.authorized_file):
-            self._create_authorized_file()
+        # Hardware probe for the current platform, generic fallback for other systems.
+        # May be replaced (e.g. in tests) before the first get_current_hwid() call.
+        self._probe = {
+            "windows": self._get_windows_hwid,
+            "linux": self._get_linux_hwid,
+            "darwin": self._get_macos_hwid,  # macOS
+        }.get(_SYSTEM, self._get_generic_hwid)
+        
+        # Memoized result of get_current_hwid()
+        self._cached_hwid: Optional[str] = None
+        
+        # In-memory authorized HWIDs used by add/remove (with the file version they
+        # were loaded from), plus batched removals not yet written by flush()
+        self._authorized: Optional[Set[str]] = None
+        self._authorized_version: Optional[Tuple[int, int, int]] = None
+        self._removed: Set[str] = set()
+        self._flush_registered = False
+        
+        # The authorized file is created on first use, see _ensure_authorized_file()
+        self._ensured = False
+        
+        # Last is_authorized() result as (timestamp, result, file version)
+        self._auth_result: Optional[Tuple[float, bool, Optional[Tuple[int, int, int]]]] = None
     
     def get_current_hwid(self) -> str:
         """
@@ -68,67 +119,154 @@ class HWIDLock:
         Returns:
             str: Unique hardware identifier
         """
+        if self._cached_hwid is not None:
+            return self._cached_hwid
+        
+        # Bound methods share their underlying function across instances
+        probe_key = getattr(self._probe, '__func__', self._probe)
+        if probe_key in _hwid_cache:
+            self._cached_hwid = _hwid_cache[probe_key]
+            return self._cached_hwid
+        
         try:
-            system = platform.system().lower()
-            hwid_components = []
-            
-            if system == "windows":
-                hwid_components.extend(self._get_windows_hwid())
-            elif system == "linux":
-                hwid_components.extend(self._get_linux_hwid())
-            elif system == "darwin":  # macOS
-                hwid_components.extend(self._get_macos_hwid())
-            else:
-                # Fallback for other systems
-                hwid_components.extend(self._get_generic_hwid())
+            hwid_components = self._probe()
             
             # Combine all components and hash
-            combined = "|".join(filter(None, hwid_components))
-            hwid = hashlib.sha256(combined.encode()).hexdigest()[:32].upper()
+            hwid = self._hash_hwid(hwid_components)
             
+            _hwid_cache[probe_key] = hwid
+            self._cached_hwid = hwid
             return hwid
             
         except Exception as e:
             # Fallback HWID generation
-            fallback = f"{platform.node()}{platform.machine()}{platform.processor()}"
-            return hashlib.sha256(fallback.encode()).hexdigest()[:32].upper()
+            fallback = [_NODE, _MACHINE, _processor()]
+            return self._hash_hwid(fallback, separator=b"")
+    
+    def _hash_hwid(self, components: List[str], separator: bytes = b"|") -> str:
+        """Hash non-empty hardware identifiers, joined by separator, into a 32 character HWID"""
+        if HASH_VERSION == 2:
+            hasher = hashlib.blake2b(digest_size=16)
+        else:
+            hasher = hashlib.sha256()
+        
+        # Feed components one at a time instead of building the joined string
+        first = True
+        for component in components:
+            if not component:
+                continue
+            if not first:
+                hasher.update(separator)
+            hasher.update(component.encode())
+            first = False
+        
+        return hasher.hexdigest()[:32].upper()
     
     def _get_windows_hwid(self) -> List[str]:
         """Get Windows-specific hardware identifiers"""
-        components = []
-        
+        # Read the SMBIOS table directly, avoiding one wmic process per value
         try:
-            # CPU ID
-            cpu_id = subprocess.check_output(
-                'wmic cpu get ProcessorId /value',
-                shell=True, text=True
-            ).strip()
-            components.append(cpu_id.split('=')[-1] if '=' in cpu_id else cpu_id)
+            components = self._parse_smbios_table(self._get_windows_smbios_table())
+            if any(components):
+                return components
         except:
             pass
         
-        try:
-            # Motherboard serial
-            mb_serial = subprocess.check_output(
-                'wmic baseboard get SerialNumber /value',
-                shell=True, text=True
-            ).strip()
-            components.append(mb_serial.split('=')[-1] if '=' in mb_serial else mb_serial)
-        except:
-            pass
+        components = []
         
         try:
-            # BIOS serial
-            bios_serial = subprocess.check_output(
-                'wmic bios get SerialNumber /value',
-                shell=True, text=True
-            ).strip()
-            components.append(bios_serial.split('=')[-1] if '=' in bios_serial else bios_serial)
+            # CPU ID, motherboard serial and BIOS serial in a single process,
+            # one line each ([string] keeps empty values on their own line)
+            # Run PowerShell directly (no cmd.exe) and without a console window
+            output = subprocess.check_output(
+                [
+                    'powershell', '-NoProfile', '-Command',
+                    '[string](Get-CimInstance Win32_Processor | Select-Object -First 1).ProcessorId; '
+                    '[string](Get-CimInstance Win32_BaseBoard | Select-Object -First 1).SerialNumber; '
+                    '[string](Get-CimInstance Win32_BIOS | Select-Object -First 1).SerialNumber',
+                ],
+                text=True, creationflags=subprocess.CREATE_NO_WINDOW
+            )
+            components.extend(line.strip() for line in output.splitlines()[:3])
         except:
             pass
         
         return components
     
+    def _get_windows_smbios_table(self) -> bytes:
+        """Get the raw SMBIOS table via GetSystemFirmwareTable"""
+        import ctypes
+        
+        kernel32 = ctypes.windll.kernel32
+        provider = int.from_bytes(b'RSMB', 'big')
+        
+        size = kernel32.GetSystemFirmwareTable(provider, 0, None, 0)
+        if not size:
+            raise OSError("GetSystemFirmwareTable failed")
+        
+        buffer = ctypes.create_string_buffer(size)
+        if kernel32.GetSystemFirmwareTable(provider, 0, buffer, size) != size:
+            raise OSError("GetSystemFirmwareTable failed")
+        
+        # Skip the RawSMBIOSData header (version bytes + DWORD table length)
+        table_length = struct.unpack_from('<I', buffer.raw, 4)[0]
+        return buffer.raw[8:8 + table_length]
+    
+    def _parse_smbios_table(self, table: bytes) -> List[str]:
+        """
+        Extract CPU ID, motherboard serial and BIOS serial from an SMBIOS table
+        
+        Values match what wmic reports for Win32_Processor.ProcessorId,
+        Win32_BaseBoard.SerialNumber and Win32_BIOS.SerialNumber.
+        
+        Args:
+            table: Raw SMBIOS structure table
+            
+        Returns:
+            List[str]: [cpu_id, motherboard_serial, bios_serial]
+        """
+        cpu_id = mb_serial = bios_serial = None
+        offset = 0
+        
+        while offset + 4 <= len(table):
+            struct_type, struct_length = table[offset], table[offset + 1]
+            if struct_length < 4:
+                break
+            
+            # Formatted area is followed by NUL-terminated strings ending in a double NUL
+            formatted = table[offset:offset + struct_length]
+            strings_end = table.find(b'\x00\x00', offset + struct_length)
+            if strings_end == -1:
+                break
+            strings = table[offset + struct_length:strings_end].split(b'\x00')
+            
+            def get_string(field: int) -> str:
+                index = formatted[field] if field < struct_length else 0
+                if 0 < index <= len(strings):
+                    return strings[index - 1].decode('ascii', 'ignore').strip()
+                return ""
+            
+            if struct_type == 1 and bios_serial is None:
+                # System information - serial number
+                bios_serial = get_string(0x07)
+            elif struct_type == 2 and mb_serial is None:
+                # Baseboard information - serial number
+                mb_serial = get_string(0x07)
+            elif (struct_type == 4 and cpu_id is None and struct_length >= 0x10
+                  and (struct_length <= 0x18 or formatted[0x18] & 0x40)):
+                # Processor information - CPUID signature (EAX) and feature flags (EDX).
+                # Sockets without the "CPU Socket Populated" status bit (0x18, bit 6)
+                # are skipped, as Win32_Processor only lists installed CPUs.
+                eax, edx = struct.unpack_from('<II', formatted, 0x08)
+                cpu_id = f"{edx:08X}{eax:08X}"
+            elif struct_type == 127:
+                # End of table
+                break
+            
+            offset = strings_end + 2
+        
+        return [cpu_id or "", mb_serial or "", bios_serial or ""]
+    
     def _get_linux_hwid(self) -> List[str]:
         """Get Linux-specific hardware identifiers"""
         components = []
@@ -142,18 +280,19 @@ class HWIDLock:
         
         try:
             # CPU info
-            cpu_info = subprocess.check_output(['cat', '/proc/cpuinfo'], text=True)
-            for line in cpu_info.split('\n'):
-                if 'processor' in line and ':' in line:
-                    components.append(line.split(':')[1].strip())
-                    break
+            # Stream lines so only the start of the file is read on many-core machines
+            with open('/proc/cpuinfo', 'r') as f:
+                for line in f:
+                    if 'processor' in line and ':' in line:
+                        components.append(line.split(':')[1].strip())
+                        break
         except:
             pass
         
         try:
             # DMI product UUID
-            uuid = subprocess.check_output(['cat', '/sys/class/dmi/id/product_uuid'], text=True)
-            components.append(uuid.strip())
+            with open('/sys/class/dmi/id/product_uuid', 'r') as f:
+                components.append(f.read().strip())
         except:
             pass
         
@@ -164,22 +303,15 @@ class HWIDLock:
         components = []
         
         try:
-            # Hardware UUID
-            uuid = subprocess.check_output(['system_profiler', 'SPHardwareDataType'], text=True)
-            for line in uuid.split('\n'):
-                if 'Hardware UUID' in line:
-                    components.append(line.split(':')[1].strip())
-                    break
-        except:
-            pass
-        
-        try:
-            # Serial number
-            serial = subprocess.check_output(['system_profiler', 'SPHardwareDataType'], text=True)
-            for line in serial.split('\n'):
-                if 'Serial Number' in line:
-                    components.append(line.split(':')[1].strip())
-                    break
+            # Hardware UUID and serial number from a single system_profiler run
+            output = subprocess.check_output(['system_profiler', 'SPHardwareDataType'], text=True)
+            uuid = serial = None
+            for line in output.splitlines():
+                if uuid is None and 'Hardware UUID' in line:
+                    uuid = line.split(':')[1].strip()
+                elif serial is None and 'Serial Number' in line:
+                    serial = line.split(':')[1].strip()
+            components.extend(value for value in (uuid, serial) if value is not None)
         except:
             pass
         
@@ -190,40 +322,108 @@ class HWIDLock:
         components = []
         
         # Basic system information
-        components.append(platform.node())
-        components.append(platform.machine())
-        components.append(platform.processor())
+        components.append(_NODE)
+        components.append(_MACHINE)
+        components.append(_processor())
         
         return components
     
-    def _create_authorized_file(self) -> None:
-        """Create the authorized HWIDs file with master HWID"""
+    def _create_authorized_file(self) -> bool:
+        """
+        Create the authorized HWIDs file with master HWID
+        
+        Returns:
+            bool: True if the file was created, False otherwise
+        """
         try:
+            # Ensure the directory (C:\hwid sys by default) exists
+            directory = os.path.dirname(self.authorized_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
             with open(self.authorized_file, 'w') as f:
                 f.write(f"# Authorized Hardware IDs\n")
-                f.write(f"# Generated on: {platform.node()}\n")
+                f.write(f"# Generated on: {_NODE}\n")
                 f.write(f"# Master HWID: {self.MASTER_HWID}\n")
                 f.write(f"{self.MASTER_HWID}\n")
+            return True
         except Exception as e:
             print(f"Error creating authorized file: {e}")
+            return False
+    
+    def _ensure_authorized_file(self) -> None:
+        """Create the authorized file if it doesn't exist, retrying until it does"""
+        if self._ensured:
+            return
+        
+        if os.path.exists(self.authorized_file) or self._create_authorized_file():
+            self._ensured = True
     
     def _load_authorized_hwids(self) -> List[str]:
         """Load authorized HWIDs from file"""
+        self._ensure_authorized_file()
         authorized_hwids = []
         
         try:
-            if os.path.exists(self.authorized_file):
-                with open(self.authorized_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip comments and empty lines
-                        if line and not line.startswith('#'):
-                            authorized_hwids.append(line.upper())
+            with open(self.authorized_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    # Skip comments and empty lines
+                    if line and not line.startswith('#'):
+                        authorized_hwids.append(line.upper())
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading authorized HWIDs: {e}")
         
         return authorized_hwids
     
+    def _get_file_version(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get (mtime_ns, size, inode) of the authorized file, or None if it can't be read
+        
+        The inode catches os.replace() rewrites that keep the size (HWIDs are fixed
+        length) on filesystems whose mtime is too coarse to change.
+        """
+        try:
+            stat = os.stat(self.authorized_file)
+        except OSError:
+            return None
+        
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _load_authorized_hwid_set(self, file_version: Optional[Tuple[int, int, int]] = None) -> FrozenSet[str]:
+        """
+        Load authorized HWIDs as a set, reusing the parsed file until it changes
+        
+        Args:
+            file_version: Version from _get_file_version() if the caller already has it
+        """
+        self._ensure_authorized_file()
+        
+        if file_version is None:
+            file_version = self._get_file_version()
+        if file_version is None:
+            return frozenset()
+        
+        cached = self._authorized_set_cache.get(self.authorized_file)
+        if cached is not None and cached[0] == file_version:
+            return cached[1]
+        
+        authorized_hwids = frozenset(self._load_authorized_hwids())
+        self._authorized_set_cache[self.authorized_file] = (file_version, authorized_hwids)
+        return authorized_hwids
+    
+    def _get_authorized_set(self) -> Set[str]:
+        """Get the in-memory authorized HWIDs, reloading them when the file changes"""
+        self._ensure_authorized_file()
+        
+        file_version = self._get_file_version()
+        if self._authorized is None or file_version != self._authorized_version:
+            self._authorized = set(self._load_authorized_hwid_set(file_version)) - self._removed
+            self._authorized_version = file_version
+        return self._authorized
+    
     def is_authorized(self) -> bool:
         """
         Check if current machine is authorized
@@ -231,10 +431,20 @@ class HWIDLock:
         Returns:
             bool: True if authorized, False otherwise
         """
+        # Reuse a recent result unless the authorized file has changed since
+        self._ensure_authorized_file()
+        now = time.monotonic()
+        file_version = self._get_file_version()
+        if self._auth_result is not None:
+            timestamp, result, cached_version = self._auth_result
+            if now - timestamp < AUTH_CACHE_TTL and file_version == cached_version:
+                return result
+        
         current_hwid = self.get_current_hwid()
-        authorized_hwids = self._load_authorized_hwids()
+        result = current_hwid in self._load_authorized_hwid_set(file_version)
         
-        return current_hwid in authorized_hwids
+        self._auth_result = (now, result, file_version)
+        return result
     
     def is_master(self) -> bool:
         """
@@ -246,6 +456,13 @@ class HWIDLock:
         current_hwid = self.get_current_hwid()
         return current_hwid == self.MASTER_HWID
     
+    def _normalize_hwid(self, hwid: str) -> Optional[str]:
+        """Canonicalize a user-supplied HWID, or return None if it can't be stored"""
+        hwid = hwid.strip().upper()
+        if not hwid or hwid.startswith('#') or '\n' in hwid or '\r' in hwid:
+            return None
+        return hwid
+    
     def add_hwid(self, hwid: str) -> bool:
         """
         Add HWID to authorized list (master only)
@@ -260,13 +477,29 @@ class HWIDLock:
             print("Error: Only master HWID can add new HWIDs")
             return False
         
+        hwid = self._normalize_hwid(hwid)
+        if hwid is None:
+            print("Error: Invalid HWID")
+            return False
+        
         try:
-            authorized_hwids = self._load_authorized_hwids()
-            hwid = hwid.upper()
+            authorized_hwids = self._get_authorized_set()
+            
+            if hwid in self._removed:
+                # Cancel the pending removal; if the line is still in the file
+                # there is nothing to write, otherwise append it again below
+                self._removed.discard(hwid)
+                if hwid in self._load_authorized_hwid_set(self._authorized_version):
+                    authorized_hwids.add(hwid)
+                    print(f"HWID {hwid} added to authorized list")
+                    return True
             
             if hwid not in authorized_hwids:
                 with open(self.authorized_file, 'a') as f:
                     f.write(f"{hwid}\n")
+                authorized_hwids.add(hwid)
+                # Our own append shouldn't trigger a reload on the next call
+                self._authorized_version = self._get_file_version()
                 print(f"HWID {hwid} added to authorized list")
                 return True
             else:
@@ -277,12 +510,19 @@ class HWIDLock:
             print(f"Error adding HWID: {e}")
             return False
     
-    def remove_hwid(self, hwid: str) -> bool:
+    def remove_hwid(self, hwid: str, batch: bool = False) -> bool:
         """
         Remove HWID from authorized list (master only)
         
+        By default the authorized file is rewritten right away. With batch=True
+        the removal is only kept in memory until flush() is called (or the
+        interpreter exits), so several removals cost a single rewrite. Until
+        then other instances and processes still treat the HWID as authorized,
+        and the removal is lost if the process is killed.
+        
         Args:
             hwid: Hardware ID to remove
+            batch: Defer writing the removal until flush()
             
         Returns:
             bool: True if successful, False otherwise
@@ -291,24 +531,32 @@ class HWIDLock:
             print("Error: Only master HWID can remove HWIDs")
             return False
         
-        if hwid.upper() == self.MASTER_HWID:
+        hwid = self._normalize_hwid(hwid)
+        if hwid is None:
+            print("Error: Invalid HWID")
+            return False
+        
+        if hwid == self.MASTER_HWID:
             print("Error: Cannot remove master HWID")
             return False
         
         try:
-            authorized_hwids = self._load_authorized_hwids()
-            hwid = hwid.upper()
+            authorized_hwids = self._get_authorized_set()
             
             if hwid in authorized_hwids:
                 authorized_hwids.remove(hwid)
+                self._removed.add(hwid)
                 
-                # Rewrite file
-                with open(self.authorized_file, 'w') as f:
-                    f.write(f"# Authorized Hardware IDs\n")
-                    f.write(f"# Generated on: {platform.node()}\n")
-                    f.write(f"# Master HWID: {self.MASTER_HWID}\n")
-                    for auth_hwid in authorized_hwids:
-                        f.write(f"{auth_hwid}\n")
+                if not batch and not self.flush():
+                    # Keep the HWID authorized in memory since the file still lists it
+                    self._removed.discard(hwid)
+                    authorized_hwids.add(hwid)
+                    return False
+                
+                if batch and not self._flush_registered:
+                    # Write batched removals at exit in case flush() is never called
+                    self._flush_registered = True
+                    atexit.register(self.flush)
                 
                 print(f"HWID {hwid} removed from authorized list")
                 return True
@@ -320,6 +568,42 @@ class HWIDLock:
             print(f"Error removing HWID: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write batched HWID removals to the authorized file
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self._removed:
+            return True
+        
+        # Stream the file into a temporary copy, dropping only the removed
+        # HWIDs so lines added elsewhere in the meantime are kept, then swap
+        # it in atomically
+        tmp_file = self.authorized_file + ".tmp"
+        try:
+            with open(self.authorized_file, 'r') as src, open(tmp_file, 'w') as dst:
+                for line in src:
+                    if line.strip().upper() not in self._removed:
+                        dst.write(line)
+            os.replace(tmp_file, self.authorized_file)
+            
+            self._removed.clear()
+            if self._authorized is not None:
+                # The in-memory set already reflects this rewrite
+                self._authorized_version = self._get_file_version()
+            return True
+            
+        except Exception as e:
+            # Don't leave a partial copy behind
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            print(f"Error saving authorized HWIDs: {e}")
+            return False
+    
     def list_authorized_hwids(self) -> List[str]:
         """
         List all authorized HWIDs (master only)
@@ -331,7 +615,8 @@ class HWIDLock:
             print("Error: Only master HWID can list authorized HWIDs")
             return []
         
-        return self._load_authorized_hwids()
+        # Hide removals that haven't been flushed yet
+        return [h for h in self._load_authorized_hwids() if h not in self._removed]
     
     def show_current_hwid(self) -> str:
         """
@@ -345,8 +630,23 @@ class HWIDLock:
         return hwid
 
 
+def compute_hwid() -> str:
+    """
+    Get the current machine's HWID without creating or writing any files
+    
+    Returns:
+        str: Current HWID
+    """
+    return HWIDLock().get_current_hwid()
+
+
 # Example usage and setup
 if __name__ == "__main__":
+    # Just print the HWID, e.g. for the setup step: python hwid_lock.py --hwid-only
+    if '--hwid-only' in sys.argv or os.environ.get('HWID_ONLY'):
+        print(compute_hwid())
+        sys.exit(0)
+    
     # Initialize HWID lock
     hwid_lock = HWIDLock()
     
@@ -364,9 +664,8 @@ if __name__ == "__main__":
         
         # Create a setup file with the current HWID for convenience
         try:
-            hwid_dir = r"C:\hwid sys"
-            os.makedirs(hwid_dir, exist_ok=True)
-            setup_file = os.path.join(hwid_dir, "setup_master_hwid.txt")
+            os.makedirs(HWID_DIR, exist_ok=True)
+            setup_file = os.path.join(HWID_DIR, "setup_master_hwid.txt")
             with open(setup_file, "w") as f:
                 f.write(f"Your HWID: {hwid_lock.get_current_hwid()}\n")
                 f.write("Copy this HWID and replace MASTER_HWID in the code\n")
@@ -380,6 +679,7 @@ if __name__ == "__main__":
         print("You are the master! You can:")
         print("- hwid_lock.add_hwid('HWID_HERE') - Add new HWID")
         print("- hwid_lock.remove_hwid('HWID_HERE') - Remove HWID")
+        print("- hwid_lock.flush() - Save removals made with remove_hwid(..., batch=True)")
         print("- hwid_lock.list_authorized_hwids() - List all authorized HWIDs")
         
         authorized = hwid_lock.list_authorized_hwids()
@@ -389,6 +689,11 @@ if __name__ == "__main__":
 
 
 # Quick access functions for easy integration
+
+# Shared HWIDLock per authorized file, reused across check_hwid_access() calls
+_instances: Dict[Optional[str], HWIDLock] = {}
+
+
 def check_hwid_access(authorized_file: str = None) -> bool:
     """
     Quick function to check HWID access
@@ -399,7 +704,10 @@ def check_hwid_access(authorized_file: str = None) -> bool:
     Returns:
         bool: True if authorized, False otherwise
     """
-    return HWIDLock(authorized_file).is_authorized()
+    hwid_lock = _instances.get(authorized_file)
+    if hwid_lock is None:
+        hwid_lock = _instances.setdefault(authorized_file, HWIDLock(authorized_file))
+    return hwid_lock.is_authorized()
 
 
 def protect_with_hwid(authorized_file: str = None) -> None: